@@ -135,6 +135,9 @@ def transpose_array(array: np.ndarray) -> np.ndarray:
 def validate_result(attributions: torch.Tensor) -> None:
     """Validate calculated attributes.
 
+    Only tensor metadata is checked, so validation of tensors placed on GPU
+    does not wait for the device to finish the computation.
+
     Args:
         attributions: Tensor with calculated attributions.
 
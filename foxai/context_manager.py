@@ -18,11 +18,12 @@ Example:
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, Tuple, Union, cast
+from multiprocessing.pool import AsyncResult, Pool
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, Union
 
 import torch
+import torch.multiprocessing as mp
 
-from foxai import explainer
 from foxai.explainer import (
     DeconvolutionCVExplainer,
     DeepLIFTCVExplainer,
@@ -47,55 +48,60 @@ from foxai.explainer import (
     OcclusionCVExplainer,
     SaliencyCVExplainer,
 )
-from foxai.explainer.base_explainer import CVExplainerT
+from foxai.explainer.base_explainer import CVExplainerT, Explainer
 from foxai.logger import create_logger
 
-_LOGGER: Optional[logging.Logger] = None
-
-
-def log() -> logging.Logger:
-    """Get or create logger."""
-    # pylint: disable = global-statement
-    global _LOGGER
-    if _LOGGER is None:
-        _LOGGER = create_logger(__name__)
-    return _LOGGER
+_LOGGER: logging.Logger = create_logger(__name__)
 
 
 class CVClassificationExplainers(Enum):
     """Enum of supported computer vision classification explainers types."""
 
-    CV_OCCLUSION_EXPLAINER: str = OcclusionCVExplainer.__name__
-    CV_INTEGRATED_GRADIENTS_EXPLAINER: str = IntegratedGradientsCVExplainer.__name__
-    CV_NOISE_TUNNEL_EXPLAINER: str = NoiseTunnelCVExplainer.__name__
-    CV_GRADIENT_SHAP_EXPLAINER: str = GradientSHAPCVExplainer.__name__
-    CV_LRP_EXPLAINER: str = LRPCVExplainer.__name__
-    CV_GUIDEDGRADCAM_EXPLAINER: str = GuidedGradCAMCVExplainer.__name__
-    CV_LAYER_INTEGRATED_GRADIENTS_EXPLAINER: str = (
-        LayerIntegratedGradientsCVExplainer.__name__
-    )
-    CV_LAYER_NOISE_TUNNEL_EXPLAINER: str = LayerNoiseTunnelCVExplainer.__name__
-    CV_LAYER_GRADIENT_SHAP_EXPLAINER: str = LayerGradientSHAPCVExplainer.__name__
-    CV_LAYER_LRP_EXPLAINER: str = LayerLRPCVExplainer.__name__
-    CV_LAYER_GRADCAM_EXPLAINER: str = LayerGradCAMCVExplainer.__name__
-    CV_INPUT_X_GRADIENT_EXPLAINER: str = InputXGradientCVExplainer.__name__
-    CV_LAYER_INPUT_X_GRADIENT_EXPLAINER: str = LayerInputXGradientCVExplainer.__name__
-    CV_DEEPLIFT_EXPLAINER: str = DeepLIFTCVExplainer.__name__
-    CV_LAYER_DEEPLIFT_EXPLAINER: str = LayerDeepLIFTCVExplainer.__name__
-    CV_DEEPLIFT_SHAP_EXPLAINER: str = DeepLIFTSHAPCVExplainer.__name__
-    CV_LAYER_DEEPLIFT_SHAP_EXPLAINER: str = LayerDeepLIFTSHAPCVExplainer.__name__
-    CV_DECONVOLUTION_EXPLAINER: str = DeconvolutionCVExplainer.__name__
-    CV_LAYER_CONDUCTANCE_EXPLAINER: str = LayerConductanceCVExplainer.__name__
-    CV_SALIENCY_EXPLAINER: str = SaliencyCVExplainer.__name__
-    CV_GUIDED_BACKPOPAGATION_EXPLAINER: str = GuidedBackpropCVExplainer.__name__
+    CV_OCCLUSION_EXPLAINER: Type[Explainer] = OcclusionCVExplainer
+    CV_INTEGRATED_GRADIENTS_EXPLAINER: Type[Explainer] = IntegratedGradientsCVExplainer
+    CV_NOISE_TUNNEL_EXPLAINER: Type[Explainer] = NoiseTunnelCVExplainer
+    CV_GRADIENT_SHAP_EXPLAINER: Type[Explainer] = GradientSHAPCVExplainer
+    CV_LRP_EXPLAINER: Type[Explainer] = LRPCVExplainer
+    CV_GUIDEDGRADCAM_EXPLAINER: Type[Explainer] = GuidedGradCAMCVExplainer
+    CV_LAYER_INTEGRATED_GRADIENTS_EXPLAINER: Type[
+        Explainer
+    ] = LayerIntegratedGradientsCVExplainer
+    CV_LAYER_NOISE_TUNNEL_EXPLAINER: Type[Explainer] = LayerNoiseTunnelCVExplainer
+    CV_LAYER_GRADIENT_SHAP_EXPLAINER: Type[Explainer] = LayerGradientSHAPCVExplainer
+    CV_LAYER_LRP_EXPLAINER: Type[Explainer] = LayerLRPCVExplainer
+    CV_LAYER_GRADCAM_EXPLAINER: Type[Explainer] = LayerGradCAMCVExplainer
+    CV_INPUT_X_GRADIENT_EXPLAINER: Type[Explainer] = InputXGradientCVExplainer
+    CV_LAYER_INPUT_X_GRADIENT_EXPLAINER: Type[
+        Explainer
+    ] = LayerInputXGradientCVExplainer
+    CV_DEEPLIFT_EXPLAINER: Type[Explainer] = DeepLIFTCVExplainer
+    CV_LAYER_DEEPLIFT_EXPLAINER: Type[Explainer] = LayerDeepLIFTCVExplainer
+    CV_DEEPLIFT_SHAP_EXPLAINER: Type[Explainer] = DeepLIFTSHAPCVExplainer
+    CV_LAYER_DEEPLIFT_SHAP_EXPLAINER: Type[Explainer] = LayerDeepLIFTSHAPCVExplainer
+    CV_DECONVOLUTION_EXPLAINER: Type[Explainer] = DeconvolutionCVExplainer
+    CV_LAYER_CONDUCTANCE_EXPLAINER: Type[Explainer] = LayerConductanceCVExplainer
+    CV_SALIENCY_EXPLAINER: Type[Explainer] = SaliencyCVExplainer
+    CV_GUIDED_BACKPOPAGATION_EXPLAINER: Type[Explainer] = GuidedBackpropCVExplainer
 
 
 class CVObjectDetectionExplainers(Enum):
     """Enum of supported computer vision object detection explainers types."""
 
-    CV_LAYER_GRADCAM_OBJECT_DETECTION_EXPLAINER: str = (
-        LayerGradCAMObjectDetectionExplainer.__name__
-    )
+    CV_LAYER_GRADCAM_OBJECT_DETECTION_EXPLAINER: Type[
+        LayerGradCAMObjectDetectionExplainer
+    ] = LayerGradCAMObjectDetectionExplainer
+
+
+# explainers which do not attach hooks to the model modules,
+# only these can explain the scripted model
+_HOOK_FREE_EXPLAINERS: Tuple[Type[Explainer], ...] = (
+    OcclusionCVExplainer,
+    IntegratedGradientsCVExplainer,
+    NoiseTunnelCVExplainer,
+    GradientSHAPCVExplainer,
+    InputXGradientCVExplainer,
+    SaliencyCVExplainer,
+)
 
 
 @dataclass
@@ -121,10 +127,10 @@ class ExplainerWithParams:
 class ExplainerClassWithParams(Generic[CVExplainerT]):
     """Holder for explainer class and it's params"""
 
-    explainer_class: CVExplainerT
+    explainer_class: Type[CVExplainerT]
     kwargs: Dict[str, Any] = field(default_factory=dict)
 
-    def __init__(self, explainer_class: CVExplainerT, **kwargs) -> None:
+    def __init__(self, explainer_class: Type[CVExplainerT], **kwargs) -> None:
         self.explainer_class = explainer_class
         if kwargs:
             self.kwargs = kwargs
@@ -132,6 +138,67 @@ class ExplainerClassWithParams(Generic[CVExplainerT]):
             self.kwargs = {}
 
 
+_EXPLAINER_INSTANCES: Dict[Type[Explainer], Explainer] = {}
+
+
+def _get_explainer_instance(explainer_class: Type[Explainer]) -> Explainer:
+    """Get explainer instance shared between all context manager calls.
+
+    Explainers do not hold any state, so a single instance of each explainer
+    class can be reused.
+
+    Args:
+        explainer_class: explainer class to instantiate.
+
+    Returns:
+        explainer instance.
+    """
+    explainer_instance: Optional[Explainer] = _EXPLAINER_INSTANCES.get(explainer_class)
+    if explainer_instance is None:
+        explainer_instance = explainer_class()
+        _EXPLAINER_INSTANCES[explainer_class] = explainer_instance
+
+    return explainer_instance
+
+
+def _run_explainer(
+    explainer_with_params: ExplainerClassWithParams,
+    model: torch.nn.Module,
+    input_tensor: torch.Tensor,
+    target: int,
+) -> torch.Tensor:
+    """Calculate attributions of a single explainer.
+
+    Defined at module level to be picklable by worker processes.
+
+    Args:
+        explainer_with_params: explainer class and it's params.
+        model: the torch model to explain.
+        input_tensor: input of the model with enabled gradient recording.
+        target: predicted target index. For which class to generate xai.
+
+    Returns:
+        attributions detached from the computation graph and moved to CPU.
+    """
+    # zero the previous gradient for the model
+    model.zero_grad()
+    explainer_instance: Explainer = _get_explainer_instance(
+        explainer_with_params.explainer_class
+    )
+    attributions: torch.Tensor = (
+        explainer_instance.calculate_features(
+            model=model,
+            input_data=input_tensor,
+            pred_label_idx=target,
+            **explainer_with_params.kwargs,
+        )
+        .detach()
+        .cpu()
+    )
+    input_tensor.grad = None
+    return attributions
+
+
 class FoXaiExplainer(Generic[CVExplainerT]):
     """Context menager for FoXAI explanation.
 
@@ -158,31 +225,52 @@ class FoXaiExplainer(Generic[CVExplainerT]):
         model: torch.nn.Module,
         explainers: List[ExplainerWithParams],
         target: int = 0,
+        num_workers: int = 1,
+        script_model: bool = False,
     ) -> None:
         """
         Args:
             model: the torch model to exavluate with CV explainer
             explainers: explainers names list, to use for model evaluation.
             target: predicted target index. For which class to generate xai.
+            num_workers: number of processes used to run explainers
+                concurrently. With `1` explainers are run sequentially in
+                the current process. Model and its input have to be picklable
+                to use more workers. Workers are started on entering the
+                context manager, when model parameters and buffers are also
+                moved to shared memory. They stay there after exit.
+            script_model: whether to compile the model with `torch.jit.script`
+                for the time of the context manager, to reduce the overhead
+                of the model forward method called many times by explainers.
+                The model is scripted on entering the context manager and
+                released on exit, so changes of the model made between
+                contexts are taken into account. If the model can not be
+                scripted, it is used as is. The
+                scripted model is used for the prediction and explainers not
+                attaching hooks to the model modules. Layer, LRP, DeepLIFT,
+                GradCAM, guided backpropagation and deconvolution explainers
+                and worker processes use the original model.
         """
 
         if not explainers:
             raise ValueError("At leas one explainer should be defined.")
 
         self.model: torch.nn.Module = model
+        self.original_model: torch.nn.Module = model
+        self.script_model: bool = script_model
         self.prev_model_training_state: bool = self.model.training
 
         self.explainer_map: Dict[str, ExplainerClassWithParams] = {
             explainer_with_params.explainer_name.name: ExplainerClassWithParams(
-                explainer_class=getattr(
-                    explainer, explainer_with_params.explainer_name.value
-                )(),
+                explainer_class=explainer_with_params.explainer_name.value,
                 **explainer_with_params.kwargs,
             )
             for explainer_with_params in explainers
         }
 
         self.target: int = target
+        self.num_workers: int = num_workers
+        self.pool: Optional[Pool] = None
 
     def __enter__(self) -> "FoXaiExplainer":
         """Verify if model is in eval() mode.
@@ -193,6 +281,14 @@ class FoXaiExplainer(Generic[CVExplainerT]):
         Returns:
             the foxai class instance.
         """
+        if self.num_workers > 1 and len(self.explainer_map) > 1:
+            # start workers first, so a failure leaves torch and model state intact
+            self.pool = mp.get_context("spawn").Pool(
+                processes=min(self.num_workers, len(self.explainer_map)),
+            )
+            # scripted model can not be pickled, workers use the original one
+            self.original_model.share_memory()
+
         self.prev_torch_grad = torch.is_grad_enabled()
         if not self.prev_torch_grad:
             log_msg: str = (
@@ -201,15 +297,23 @@ class FoXaiExplainer(Generic[CVExplainerT]):
                 + "to be toggled to gradients enabled. For the "
                 + "model prediction, the gradient is temporary turned off."
             )
-            log().warning(log_msg)
+            _LOGGER.warning(log_msg)
             torch.set_grad_enabled(True)
 
-        if self.model.training:
+        if self.prev_model_training_state:
             self.model.eval()
-            log().warning(
+            _LOGGER.warning(
                 "The model should be in the eval model. Toggling it to eval mode right now."
             )
 
+        if self.script_model:
+            try:
+                self.model = torch.jit.script(self.original_model)
+            except Exception as error:  # pylint: disable = (broad-except)
+                _LOGGER.warning(
+                    "The model could not be scripted, using it as is: %s", error
+                )
+
         return self
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
@@ -220,9 +324,17 @@ class FoXaiExplainer(Generic[CVExplainerT]):
         manager modes, nothings changes.
 
         Setup model to previous state: `eval` or `training` to match initial
-        state.
+        state and replace scripted model with the original one.
+
+        Stop worker processes, if they were started.
         """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
         torch.set_grad_enabled(self.prev_torch_grad)
+        self.model = self.original_model
         self.model.train(self.prev_model_training_state)
 
     def __call__(self, *args, **kwargs) -> Tuple[Any, Dict[str, torch.Tensor]]:
@@ -237,42 +349,71 @@ class FoXaiExplainer(Generic[CVExplainerT]):
             the model output and explanations for each requested explainer.
         """
 
-        with torch.no_grad():
-            model_output: Any = self.model(*args, **kwargs)
-
         if len(args) != 1:
             # TODO: add support in explainer for multiple input models
             raise NotImplementedError(
                 "calculate_features() functions "
                 + "in explainers does not support multiple inputs to the model."
             )
-        input_tensor: torch.Tensor = cast(torch.Tensor, args)[0]
+        input_tensor: torch.Tensor = args[0]
+
+        # move input to the model device once, instead of copying it
+        # in every explainer
+        model_parameter: Optional[torch.nn.Parameter] = next(
+            self.model.parameters(), None
+        )
+        if (
+            model_parameter is not None
+            and input_tensor.device != model_parameter.device
+        ):
+            input_tensor = input_tensor.detach()
+            if model_parameter.device.type == "cuda" and not input_tensor.is_cuda:
+                input_tensor = input_tensor.pin_memory()
+            # copy is queued on the current stream, before the model forward
+            input_tensor = input_tensor.to(model_parameter.device, non_blocking=True)
+
+        with torch.no_grad():
+            model_output: Any = self.model(input_tensor, **kwargs)
+
         # cashe tensor requires grad state
         prev_requires_grad: bool = input_tensor.requires_grad
         # turn on requires grad for the input tensor
         input_tensor.requires_grad = True
 
         explanations: Dict[str, torch.Tensor] = {}
-        for explainer_name in self.explainer_map:
-            # zero the previous gradient for the model
-            self.model.zero_grad()
-            # run explainer
-            explainer_kwargs: Dict[str, Any] = self.explainer_map[explainer_name].kwargs
-            explainer_class: CVExplainerT = self.explainer_map[
-                explainer_name
-            ].explainer_class
-
-            explanations[explainer_name] = (
-                explainer_class.calculate_features(
-                    model=self.model,
-                    input_data=input_tensor,
-                    pred_label_idx=self.target,
-                    **explainer_kwargs,
-                )
-                .detach()
-                .cpu()
+        if self.pool is not None:
+            # move tensors storage to shared memory, so workers do not copy it,
+            # input is copied to leave the caller's tensor intact
+            shared_input_tensor: torch.Tensor = (
+                input_tensor.detach().clone().share_memory_().requires_grad_()
             )
-            input_tensor.grad = None
+            async_results: Dict[str, AsyncResult] = {}
+            for explainer_name, explainer_with_params in self.explainer_map.items():
+                async_results[explainer_name] = self.pool.apply_async(
+                    _run_explainer,
+                    (
+                        explainer_with_params,
+                        self.original_model,
+                        shared_input_tensor,
+                        self.target,
+                    ),
+                )
+            for explainer_name, async_result in async_results.items():
+                explanations[explainer_name] = async_result.get()
+        else:
+            for explainer_name, explainer_with_params in self.explainer_map.items():
+                # hooks can not be attached to modules of the scripted model
+                explainer_model: torch.nn.Module = (
+                    self.model
+                    if explainer_with_params.explainer_class in _HOOK_FREE_EXPLAINERS
+                    else self.original_model
+                )
+                explanations[explainer_name] = _run_explainer(
+                    explainer_with_params=explainer_with_params,
+                    model=explainer_model,
+                    input_tensor=input_tensor,
+                    target=self.target,
+                )
 
         # restore tensor requires grad state
         input_tensor.requires_grad = prev_requires_grad
@@ -3,6 +3,7 @@
 Based on https://github.com/pytorch/captum/blob/master/captum/attr/_core/noise_tunnel.py.
 """
 
+import weakref
 from abc import abstractmethod
 from typing import Optional, Tuple, Union
 
@@ -14,6 +15,48 @@ from foxai.array_utils import validate_result
 from foxai.explainer.base_explainer import Explainer
 from foxai.explainer.computer_vision.model_utils import get_last_conv_model_layer
 
+# default number of integrated gradients steps per noise tunnel sample
+_IG_N_STEPS: int = 50
+# estimated ratio of memory used by a single step to the size of the input
+_STEP_MEMORY_FACTOR: int = 4
+# fraction of free GPU memory allowed to be used by noise tunnel samples
+_FREE_MEMORY_FRACTION: float = 0.5
+# last convolutional layer of already explained models
+_LAST_CONV_LAYERS: "weakref.WeakKeyDictionary[torch.nn.Module, torch.nn.Module]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_nt_samples_batch_size(
+    input_data: torch.Tensor,
+    nt_samples: int,
+) -> Optional[int]:
+    """Estimate the number of noise tunnel samples fitting into free GPU memory.
+
+    Args:
+        input_data: Input tensor placed on GPU.
+        nt_samples: The number of randomly generated examples
+            per sample in the input batch.
+
+    Returns:
+        The number of samples to process together or None if all `nt_samples`
+        fit into memory at once.
+    """
+    free_memory, _ = torch.cuda.mem_get_info(input_data.device)
+    sample_memory: int = (
+        input_data.element_size()
+        * input_data.numel()
+        * _IG_N_STEPS
+        * _STEP_MEMORY_FACTOR
+    )
+    nt_samples_batch_size: int = max(
+        1, int(free_memory * _FREE_MEMORY_FRACTION // sample_memory)
+    )
+    if nt_samples_batch_size >= nt_samples:
+        return None
+
+    return nt_samples_batch_size
+
 
 class BaseNoiseTunnelCVExplainer(Explainer):
     """Base Noise Tunnel algorithm explainer."""
@@ -88,7 +131,9 @@ class BaseNoiseTunnelCVExplainer(Explainer):
                 reduce the number of randomly generated examples per sample
                 in each batch.
                 Default: None if `nt_samples_batch_size` is not provided. In
-                this case all `nt_samples` will be processed together.
+                this case all `nt_samples` will be processed together or,
+                for inputs placed on GPU, as many of them as fit into half of
+                the free GPU memory.
             stdevs: The standard deviation
                 of gaussian noise with zero mean that is added to each
                 input in the batch. If `stdevs` is a single float value
@@ -117,6 +162,12 @@ class BaseNoiseTunnelCVExplainer(Explainer):
 
         noise_tunnel = self.create_explainer(model=model, layer=layer)
 
+        if nt_samples_batch_size is None and input_data.is_cuda:
+            nt_samples_batch_size = get_nt_samples_batch_size(
+                input_data=input_data,
+                nt_samples=nt_samples,
+            )
+
         attributions = noise_tunnel.attribute(
             inputs=input_data,
             nt_type=nt_type,
@@ -164,7 +215,8 @@ class LayerNoiseTunnelCVExplainer(BaseNoiseTunnelCVExplainer):
 
         Uses parameter `layer` from `kwargs`. If not provided function will call
         `get_last_conv_model_layer` function to obtain last `torch.nn.Conv2d` layer
-        from provided model.
+        from provided model. The found layer is reused for later calls with
+        the same model.
 
         Args:
             model: The forward function of the model or any
@@ -184,7 +236,10 @@ class LayerNoiseTunnelCVExplainer(BaseNoiseTunnelCVExplainer):
             ValueError: if model does not contain conv layers.
         """
         if layer is None:
-            layer = get_last_conv_model_layer(model=model)
+            layer = _LAST_CONV_LAYERS.get(model)
+            if layer is None:
+                layer = get_last_conv_model_layer(model=model)
+                _LAST_CONV_LAYERS[model] = layer
 
         integrated_gradients = LayerIntegratedGradients(forward_func=model, layer=layer)
         return NoiseTunnel(integrated_gradients)
@@ -0,0 +1,11 @@
+# pylint: disable = missing-module-docstring
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def pikachu_image() -> np.ndarray:
+    """Sample image shared by all tests."""
+    return np.load(Path(__file__).parent / "data" / "pikachu.npy")
@@ -1,9 +1,10 @@
 # pylint: disable = missing-class-docstring
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional  # , TypeAlias
+from typing import Any, Callable, Dict, List, Optional, Type  # , TypeAlias
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 import torch
 from torchvision import transforms
@@ -15,8 +16,10 @@ from foxai.context_manager import (
     FoXaiExplainer,
 )
 from foxai.explainer.base_explainer import CVExplainerT
+from foxai.explainer.computer_vision.algorithm.noise_tunnel import (
+    get_nt_samples_batch_size,
+)
 from foxai.logger import create_logger
-from tests.pickachu_image import pikachu_image
 from tests.sample_model import SampleModel
 
 GetExplainerKwargsT = Callable[
@@ -50,7 +53,7 @@ class TestExplainers:
         ) -> Dict[str, Any]:
             # create parameters for explainers, that require custom parameters
             function_kwargs: Dict[str, Any] = {}
-            explainer_class: CVExplainerT = getattr(explainer, explainer_name.value)
+            explainer_class: Type[CVExplainerT] = explainer_name.value
             # check whether class contains 'create_explainer' function
             class_function: Optional[Callable] = getattr(
                 explainer_class, "create_explainer", None
@@ -78,6 +81,7 @@ class TestExplainers:
         classifier: SampleModel,
         explainer_function_kwargs: GetExplainerKwargsT,
         explainer_name: str,
+        pikachu_image: np.ndarray,
     ):
         """Test all available explainers on a simple classifier model using cpu."""
         classifier.train()
@@ -112,6 +116,7 @@ class TestExplainers:
         classifier: SampleModel,
         explainer_function_kwargs: GetExplainerKwargsT,
         explainer_name: str,
+        pikachu_image: np.ndarray,
     ):
         """Test all available explainers on a simple classifier model using gpu."""
 
@@ -484,3 +489,32 @@ def test_saliency_raises_error_if_attributes_are_empty(
             input_data=torch.zeros((1, 1, 28, 28)),
             pred_label_idx=0,
         )
+
+
+@patch("foxai.explainer.computer_vision.algorithm.noise_tunnel.torch.cuda.mem_get_info")
+def test_nt_samples_batch_size_fits_free_gpu_memory(
+    fake_mem_get_info: MagicMock,
+) -> None:
+    """Test if noise tunnel samples are split into batches fitting free GPU memory."""
+    input_data = torch.zeros((1, 1, 28, 28))
+    sample_memory = input_data.element_size() * input_data.numel() * 50 * 4
+    fake_mem_get_info.return_value = (sample_memory * 6, sample_memory * 100)
+
+    assert get_nt_samples_batch_size(input_data=input_data, nt_samples=5) == 3
+    assert get_nt_samples_batch_size(input_data=input_data, nt_samples=2) is None
+
+
+@patch(
+    "foxai.explainer.computer_vision.algorithm.noise_tunnel.get_last_conv_model_layer"
+)
+def test_layer_noise_tunnel_looks_up_last_conv_layer_once(
+    fake_get_last_conv_model_layer: MagicMock,
+) -> None:
+    """Test if the last conv layer is searched only on the first explainer creation."""
+    model = SampleModel()
+    fake_get_last_conv_model_layer.return_value = model.conv1
+    explainer_alg = explainer.LayerNoiseTunnelCVExplainer()
+    _ = explainer_alg.create_explainer(model=model)
+    _ = explainer_alg.create_explainer(model=model)
+
+    fake_get_last_conv_model_layer.assert_called_once_with(model=model)
@@ -39,3 +39,14 @@ def test_get_last_conv_model_layer_should_return_last_conv_layer() -> None:
 
     layer = get_last_conv_model_layer(model=model)
     assert layer == model.conv2
+
+
+def test_modify_modules_should_replace_relu_added_after_modification() -> None:
+    """Test if function modifies ReLU activations added to already modified model."""
+    model = AutoEncoder()
+    _ = modify_modules(model=model)
+
+    model.decoder[1] = torch.nn.ReLU(inplace=True)
+    new_model = modify_modules(model=model)
+
+    assert new_model.decoder[1].inplace is False
@@ -21,20 +21,16 @@ class SampleModel(torch.nn.Module):
         )
 
         output_channels: int = ((resolution // self.stride) ** 2) * self.out_channels
-        self.cls = torch.nn.Sequential(
-            torch.nn.Dropout(),
-            torch.nn.Linear(in_features=output_channels, out_features=1, bias=True),
+        self.linear = torch.nn.Linear(
+            in_features=output_channels, out_features=1, bias=True
         )
-        self.sigmoid = torch.nn.Sigmoid()
         self.name = "SampleModel"
 
     def forward(self, x_tensor: torch.Tensor) -> torch.Tensor:
         """Forward methid for the module."""
         x_tensor = F.relu(self.conv1(x_tensor))
-        x_tensor = x_tensor.view(x_tensor.size(0), -1)
-        x_tensor = self.cls(x_tensor)
-        x_tensor = self.sigmoid(x_tensor)
-        return x_tensor
+        x_tensor = x_tensor.flatten(1)
+        return torch.sigmoid(self.linear(x_tensor))
 
 
 class AutoEncoder(torch.nn.Module):
@@ -69,3 +65,19 @@ class CNN(torch.nn.Module):
     def forward(self, x_tensor: torch.Tensor) -> torch.Tensor:
         x_tensor = F.relu(self.conv1(x_tensor))
         return F.relu(self.conv2(x_tensor))
+
+
+class GridCachingModel(torch.nn.Module):
+    """Sample pytorch model caching a tensor on the first forward call,
+    similar to grids of YOLO detection layer."""
+
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(1, 4, 5, stride=16)
+        self.grid = torch.zeros(0)
+
+    def forward(self, x_tensor: torch.Tensor) -> torch.Tensor:
+        x_tensor = self.conv1(x_tensor)
+        if self.grid.shape != x_tensor.shape[2:]:
+            self.grid = torch.ones(x_tensor.shape[2:], device=x_tensor.device)
+        return (x_tensor * self.grid).flatten(1).sum(dim=1, keepdim=True)
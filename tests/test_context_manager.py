@@ -1,7 +1,9 @@
 # pylint: disable = missing-class-docstring
 import logging
 from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 import torch
 from torchvision import transforms
@@ -10,10 +12,19 @@ from foxai.context_manager import (
     CVClassificationExplainers,
     ExplainerWithParams,
     FoXaiExplainer,
+    _run_explainer,
 )
 from foxai.explainer import InputXGradientCVExplainer
-from tests.pickachu_image import pikachu_image
-from tests.sample_model import SampleModel
+from tests.sample_model import GridCachingModel, SampleModel
+
+_TRANSFORM: transforms.Compose = transforms.Compose(
+    [
+        transforms.ToTensor(),
+        transforms.Grayscale(),
+        transforms.Resize(size=224),
+        transforms.CenterCrop(size=224),
+    ]
+)
 
 
 class TestFoXaiExplainer:
@@ -27,21 +38,18 @@ class TestFoXaiExplainer:
         """Sample model to run FoXaiExplainer on."""
         return SampleModel()
 
-    def test_evel_mode(self, classifier: SampleModel, caplog: pytest.LogCaptureFixture):
+    def test_evel_mode(
+        self,
+        classifier: SampleModel,
+        caplog: pytest.LogCaptureFixture,
+        pikachu_image: np.ndarray,
+    ):
         """Test whether FoXaiExplainer correctly switches to eval mode
         if the model was given in train mode and if the proper WARNING
         massage if provided."""
 
         classifier.train()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
         caplog.set_level(level=logging.WARNING, logger="foxai.context_manager")
 
         with FoXaiExplainer(
@@ -57,7 +65,9 @@ class TestFoXaiExplainer:
             assert not xai_model.model.training
             assert "The model should be in the eval model" in caplog.text
 
-    def test_no_explainers_given(self, classifier: torch.nn.Module):
+    def test_no_explainers_given(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
         """Test whether FoXaiExplainer correctly raises error,
         if explainers not provided.
 
@@ -65,15 +75,7 @@ class TestFoXaiExplainer:
         """
 
         classifier.eval()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
 
         with pytest.raises(ValueError):
             with FoXaiExplainer(
@@ -82,21 +84,15 @@ class TestFoXaiExplainer:
             ) as xai_model:
                 _, _ = xai_model(img_tensor)
 
-    def test_whether_output_match_requested_inputs(self, classifier: torch.nn.Module):
+    def test_whether_output_match_requested_inputs(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
         """Test whether FoXaiExplainer returns explanations,
         for each requested explainer.
         """
 
         classifier.eval()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
 
         explainers: List[ExplainerWithParams] = [
             ExplainerWithParams(CVClassificationExplainers.CV_GRADIENT_SHAP_EXPLAINER),
@@ -113,21 +109,15 @@ class TestFoXaiExplainer:
                 map(lambda explainer: explainer.explainer_name.name, explainers)
             ) == list(xai_explanations.keys())
 
-    def test_model_inference_with_explainer(self, classifier: torch.nn.Module):
+    def test_model_inference_with_explainer(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
         """Test whether regular inference and inference with FoXaiExplainer
         gives same results.
         """
 
         classifier.eval()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
 
         inference_output = classifier(img_tensor)
 
@@ -143,22 +133,16 @@ class TestFoXaiExplainer:
 
             assert foxai_inference_output == inference_output
 
-    def test_model_with_disabled_gradients(self, classifier: torch.nn.Module):
+    def test_model_with_disabled_gradients(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
         """Test whether model properly turns gradients enabled, when feed
         with model without gradients enabled and whether model correctly
         turns gradient back to the input state.
         """
 
         classifier.eval()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
 
         with torch.no_grad():
             with FoXaiExplainer(
@@ -206,22 +190,14 @@ class TestFoXaiExplainer:
             assert explainer_kwargs["window_value"] == 5
 
     def test_model_explanation_with_context_manager_and_raw(
-        self, classifier: torch.nn.Module
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
     ):
         """Test whether explanations from context manager and explainer class
         gives same results.
         """
 
         classifier.eval()
-        transform = transforms.Compose(
-            [
-                transforms.ToTensor(),
-                transforms.Grayscale(),
-                transforms.Resize(size=224),
-                transforms.CenterCrop(size=224),
-            ]
-        )
-        img_tensor: torch.Tensor = transform(pikachu_image).unsqueeze(0)
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
 
         explainer_attributes = InputXGradientCVExplainer().calculate_features(
             model=classifier,
@@ -268,3 +244,270 @@ class TestFoXaiExplainer:
                 assert not classifier.training
 
         assert classifier.training
+
+    def test_explainers_run_in_worker_processes(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
+        """Test whether explanations calculated in worker processes match
+        the ones calculated sequentially.
+        """
+
+        classifier.eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        explainers: List[ExplainerWithParams] = [
+            ExplainerWithParams(
+                CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+            ),
+            ExplainerWithParams(CVClassificationExplainers.CV_SALIENCY_EXPLAINER),
+        ]
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=explainers,
+        ) as xai_model:
+            _, sequential_attributes_dict = xai_model(img_tensor)
+
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=explainers,
+            num_workers=2,
+        ) as xai_model:
+            pool = xai_model.pool
+            _, parallel_attributes_dict = xai_model(img_tensor)
+            _, _ = xai_model(img_tensor)
+
+            assert pool is not None
+            assert xai_model.pool is pool
+
+        assert xai_model.pool is None
+        assert not img_tensor.is_shared()
+
+        assert list(sequential_attributes_dict.keys()) == list(
+            parallel_attributes_dict.keys()
+        )
+        for explainer_name, attributes in sequential_attributes_dict.items():
+            assert torch.equal(parallel_attributes_dict[explainer_name], attributes)
+
+    def test_failed_worker_start_leaves_state_intact(self, classifier: torch.nn.Module):
+        """Test whether failure to start workers keeps gradient and training modes."""
+
+        classifier.train()
+        xai_model = FoXaiExplainer(
+            model=classifier,
+            explainers=[
+                ExplainerWithParams(
+                    CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+                ),
+                ExplainerWithParams(CVClassificationExplainers.CV_SALIENCY_EXPLAINER),
+            ],
+            num_workers=2,
+        )
+
+        with torch.no_grad(), patch(
+            "foxai.context_manager.mp.get_context",
+            side_effect=OSError("no workers"),
+        ):
+            with pytest.raises(OSError):
+                with xai_model:
+                    pass
+
+            assert not torch.is_grad_enabled()
+            assert classifier.training
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="GPU not detected.")
+    def test_cpu_input_is_moved_to_model_device(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
+        """Test whether input placed on CPU is explained with model placed on GPU."""
+
+        classifier.eval().to(torch.device("cuda"))
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=[
+                ExplainerWithParams(
+                    CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+                )
+            ],
+        ) as xai_model:
+            output, foxai_attributes_dict = xai_model(img_tensor)
+
+        assert output.is_cuda
+        assert (
+            foxai_attributes_dict[
+                CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER.name
+            ].shape
+            == img_tensor.shape
+        )
+
+    def test_model_explanation_with_scripted_model(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
+        """Test whether explanations of scripted model match the ones of the
+        original model and whether the original model is restored after exit.
+        """
+
+        classifier.eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        explainer_attributes = InputXGradientCVExplainer().calculate_features(
+            model=classifier,
+            input_data=img_tensor,
+            pred_label_idx=0,
+        )
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=[
+                ExplainerWithParams(
+                    CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+                )
+            ],
+            script_model=True,
+        ) as xai_model:
+            assert isinstance(xai_model.model, torch.jit.ScriptModule)
+            _, foxai_attributes_dict = xai_model(img_tensor)
+
+        assert xai_model.model is classifier
+        assert torch.allclose(
+            foxai_attributes_dict[
+                CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER.name
+            ],
+            explainer_attributes,
+        )
+
+    @pytest.mark.parametrize("explainer_name", list(CVClassificationExplainers))
+    def test_explainers_with_scripted_model(
+        self,
+        classifier: torch.nn.Module,
+        pikachu_image: np.ndarray,
+        explainer_name: CVClassificationExplainers,
+    ):
+        """Test whether every explainer runs with scripted model and whether
+        the scripted model is dropped on exit.
+        """
+
+        classifier.eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=[ExplainerWithParams(explainer_name)],
+            script_model=True,
+        ) as xai_model:
+            assert isinstance(xai_model.model, torch.jit.ScriptModule)
+            _, _ = xai_model(img_tensor)
+
+        assert xai_model.model is classifier
+
+    def test_scripted_model_follows_model_dtype_change(self):
+        """Test whether model converted to other dtype between contexts is
+        scripted again with the converted buffers.
+        """
+
+        model = torch.nn.Sequential(
+            torch.nn.Conv2d(1, 2, 3),
+            torch.nn.BatchNorm2d(2),
+            torch.nn.Flatten(),
+            torch.nn.Linear(72, 1),
+        ).eval()
+        explainers: List[ExplainerWithParams] = [
+            ExplainerWithParams(CVClassificationExplainers.CV_SALIENCY_EXPLAINER)
+        ]
+
+        with FoXaiExplainer(
+            model=model, explainers=explainers, script_model=True
+        ) as xai_model:
+            _, _ = xai_model(torch.rand((1, 1, 8, 8)))
+
+        model.to(torch.float64)
+        with FoXaiExplainer(
+            model=model, explainers=explainers, script_model=True
+        ) as xai_model:
+            output, _ = xai_model(torch.rand((1, 1, 8, 8), dtype=torch.float64))
+
+        assert output.dtype == torch.float64
+
+    def test_scripted_model_with_worker_processes(
+        self, classifier: torch.nn.Module, pikachu_image: np.ndarray
+    ):
+        """Test whether explainers run in worker processes with scripted model."""
+
+        classifier.eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        with FoXaiExplainer(
+            model=classifier,
+            explainers=[
+                ExplainerWithParams(
+                    CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+                ),
+                ExplainerWithParams(CVClassificationExplainers.CV_LRP_EXPLAINER),
+            ],
+            num_workers=2,
+            script_model=True,
+        ) as xai_model:
+            _, xai_explanations = xai_model(img_tensor)
+
+        assert len(xai_explanations) == 2
+
+    def test_model_caching_tensor_in_forward(self, pikachu_image: np.ndarray):
+        """Test whether explainers work with model caching a tensor created
+        during the model prediction.
+        """
+
+        model = GridCachingModel().eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+
+        with FoXaiExplainer(
+            model=model,
+            explainers=[
+                ExplainerWithParams(CVClassificationExplainers.CV_SALIENCY_EXPLAINER)
+            ],
+        ) as xai_model:
+            output, _ = xai_model(img_tensor)
+
+        weight = torch.ones_like(output, requires_grad=True)
+        (output * weight).sum().backward()
+
+    @pytest.mark.parametrize("requires_grad", [True, False])
+    def test_input_moved_to_model_device_is_detached(
+        self,
+        classifier: torch.nn.Module,
+        pikachu_image: np.ndarray,
+        requires_grad: bool,
+    ):
+        """Test whether input placed on other device than the model is detached
+        before moving and whether the caller's tensor keeps its requires grad state.
+        """
+
+        classifier.eval()
+        img_tensor: torch.Tensor = _TRANSFORM(pikachu_image).unsqueeze(0)
+        # non-leaf tensor, requires grad flag of which can not be changed
+        img_tensor = img_tensor * torch.ones(1, requires_grad=requires_grad)
+        # `cpu:0` device differs from `cpu` device of the input
+        fake_parameter = MagicMock(device=torch.device("cpu", 0), grad=None)
+
+        with patch.object(
+            classifier, "parameters", side_effect=lambda: iter([fake_parameter])
+        ), patch(
+            "foxai.context_manager._run_explainer", wraps=_run_explainer
+        ) as fake_run_explainer:
+            with FoXaiExplainer(
+                model=classifier,
+                explainers=[
+                    ExplainerWithParams(
+                        CVClassificationExplainers.CV_INPUT_X_GRADIENT_EXPLAINER
+                    )
+                ],
+            ) as xai_model:
+                _, _ = xai_model(img_tensor)
+
+        explained_tensor: torch.Tensor = fake_run_explainer.call_args.kwargs[
+            "input_tensor"
+        ]
+        assert explained_tensor is not img_tensor
+        assert explained_tensor.is_leaf
+        assert explained_tensor.grad_fn is None
+        assert img_tensor.requires_grad == requires_grad
+        assert img_tensor.grad is None